@@ -8,7 +8,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +18,9 @@ from pathlib import Path
 from valuecell.utils.db import resolve_db_path, resolve_lancedb_uri
 from valuecell.utils.env import get_system_env_dir
 
+_COPY_BUFFER_SIZE = 1 << 20
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 @dataclass
 class CleanupAction:
@@ -24,6 +29,20 @@ class CleanupAction:
     should_delete: bool
 
 
+def _is_nonempty(path: Path) -> bool:
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
+
+
+def _list_entry_names(path: Path) -> set[str]:
+    """Return the names in ``path`` (empty if missing) from a single readdir."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
 def _legacy_db_paths() -> list[Path]:
     legacy_db = Path(get_system_env_dir()) / "valuecell.db"
     return [
@@ -34,6 +53,50 @@ def _legacy_db_paths() -> list[Path]:
     ]
 
 
+def _fastcopy(src: Path, dst: Path) -> None:
+    """Copy a single file, letting the kernel move the bytes when possible."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            # copy_file_range is Linux-only and may refuse some filesystems;
+            # both file offsets have advanced, so the loop below resumes.
+            pass
+
+        buf = bytearray(_COPY_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            read = fsrc.readinto(buf)
+            if not read:
+                break
+            fdst.write(view[:read])
+    shutil.copystat(src, dst)
+
+
+def _plan_tree_copy(src: Path, dst: Path, pairs: list[tuple[Path, Path]]) -> None:
+    """Create the directory skeleton of ``src`` under ``dst`` and queue its files."""
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = dst / entry.name
+            if entry.is_dir():
+                _plan_tree_copy(Path(entry.path), target, pairs)
+            else:
+                pairs.append((Path(entry.path), target))
+
+
+def _copy_files(pairs: list[tuple[Path, Path]]) -> None:
+    # Per-file copies are syscall bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        for _ in executor.map(lambda pair: _fastcopy(*pair), pairs):
+            pass
+
+
 def _collect_actions() -> list[CleanupAction]:
     actions: list[CleanupAction] = []
 
@@ -41,11 +104,12 @@ def _collect_actions() -> list[CleanupAction]:
     active_lancedb = Path(resolve_lancedb_uri())
 
     legacy_base = Path(get_system_env_dir())
+    legacy_entries = _list_entry_names(legacy_base)
     backup_root = active_db.parent / "backups" / datetime.now().strftime("%Y%m%d_%H%M%S")
 
     if active_db.exists():
         for legacy_file in _legacy_db_paths():
-            if legacy_file.exists() and legacy_file != active_db:
+            if legacy_file.name in legacy_entries and legacy_file != active_db:
                 backup_target = backup_root / "legacy_db" / legacy_file.name
                 actions.append(
                     CleanupAction(
@@ -57,10 +121,10 @@ def _collect_actions() -> list[CleanupAction]:
 
     legacy_lancedb = legacy_base / "lancedb"
     if (
-        legacy_lancedb.exists()
+        legacy_lancedb.name in legacy_entries
         and legacy_lancedb != active_lancedb
         and active_lancedb.exists()
-        and any(active_lancedb.iterdir())
+        and _is_nonempty(active_lancedb)
     ):
         actions.append(
             CleanupAction(
@@ -86,16 +150,23 @@ def _run(actions: list[CleanupAction], dry_run: bool) -> None:
         print("Dry-run mode enabled. No files were modified.")
         return
 
+    pairs: list[tuple[Path, Path]] = []
     for action in actions:
         action.backup.parent.mkdir(parents=True, exist_ok=True)
         if action.source.is_dir():
-            shutil.copytree(action.source, action.backup, dirs_exist_ok=True)
-            if action.should_delete:
-                shutil.rmtree(action.source)
+            _plan_tree_copy(action.source, action.backup, pairs)
+        else:
+            pairs.append((action.source, action.backup))
+
+    _copy_files(pairs)
+
+    for action in actions:
+        if not action.should_delete:
+            continue
+        if action.source.is_dir():
+            shutil.rmtree(action.source)
         else:
-            shutil.copy2(action.source, action.backup)
-            if action.should_delete:
-                action.source.unlink(missing_ok=True)
+            action.source.unlink(missing_ok=True)
 
     print("Legacy cleanup completed.")
 
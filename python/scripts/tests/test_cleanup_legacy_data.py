@@ -0,0 +1,124 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "cleanup_legacy_data.py"
+_spec = importlib.util.spec_from_file_location("cleanup_legacy_data", _SCRIPT)
+cleanup = importlib.util.module_from_spec(_spec)
+# dataclasses resolves the module's annotations through sys.modules
+sys.modules[_spec.name] = cleanup
+_spec.loader.exec_module(cleanup)
+
+
+@pytest.fixture
+def legacy(tmp_path):
+    """A nested legacy tree plus a standalone file, with distinct mtimes."""
+    base = tmp_path / "legacy"
+    tree = base / "lancedb"
+    files = {
+        tree / "big.bin": os.urandom(cleanup._COPY_BUFFER_SIZE * 2 + 123),
+        tree / "docs.lance" / "meta.json": b'{"version": 1}',
+        tree / "docs.lance" / "data" / "part-0.bin": os.urandom(4096),
+        tree / "docs.lance" / "empty.txt": b"",
+        base / "valuecell.db": os.urandom(1000),
+    }
+    for index, (path, data) in enumerate(files.items()):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        mtime_ns = 1_600_000_000_123_456_789 + index * 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    (tree / "empty_dir").mkdir()
+
+    backup = tmp_path / "backup"
+    actions = [
+        cleanup.CleanupAction(tree, backup / "legacy_lancedb", should_delete=True),
+        cleanup.CleanupAction(
+            base / "valuecell.db", backup / "legacy_db" / "valuecell.db", True
+        ),
+    ]
+    copies = {
+        src: (backup / "legacy_lancedb" / src.relative_to(tree))
+        if src.is_relative_to(tree)
+        else backup / "legacy_db" / src.name
+        for src in files
+    }
+    originals = {src: (data, src.stat().st_mtime_ns) for src, data in files.items()}
+    return actions, copies, originals
+
+
+def _assert_copied(copies, originals):
+    for src, dst in copies.items():
+        data, mtime_ns = originals[src]
+        assert dst.read_bytes() == data
+        assert dst.stat().st_mtime_ns == mtime_ns
+
+
+def test_run_copies_tree_then_deletes_sources(legacy):
+    actions, copies, originals = legacy
+
+    cleanup._run(actions, dry_run=False)
+
+    _assert_copied(copies, originals)
+    assert (actions[0].backup / "empty_dir").is_dir()
+    assert all(not action.source.exists() for action in actions)
+
+
+def test_fastcopy_resumes_after_partial_copy_file_range(legacy, monkeypatch):
+    actions, copies, originals = legacy
+    calls = []
+
+    def copy_first_chunk_then_fail(src_fd, dst_fd, count, *args):
+        # Copy one chunk the way the kernel would (advancing both offsets),
+        # then refuse, so the buffered loop has to pick up mid-file
+        if calls:
+            raise OSError("copy_file_range unsupported")
+        calls.append(count)
+        data = os.read(src_fd, min(count, cleanup._COPY_BUFFER_SIZE))
+        return os.write(dst_fd, data)
+
+    monkeypatch.setattr(cleanup, "_COPY_WORKERS", 1)
+    monkeypatch.setattr(
+        cleanup.os, "copy_file_range", copy_first_chunk_then_fail, raising=False
+    )
+    big = actions[0].source / "big.bin"
+    dst = copies[big]
+    dst.parent.mkdir(parents=True)
+
+    cleanup._fastcopy(big, dst)
+
+    assert calls == [len(originals[big][0])]
+    assert dst.read_bytes() == originals[big][0]
+    assert dst.stat().st_mtime_ns == originals[big][1]
+
+    cleanup._run(actions, dry_run=False)
+    _assert_copied(copies, originals)
+
+
+def test_run_keeps_sources_when_any_copy_fails(legacy, monkeypatch):
+    actions, copies, _ = legacy
+    real_fastcopy = cleanup._fastcopy
+    failing = actions[0].source / "docs.lance" / "meta.json"
+
+    def fastcopy(src, dst):
+        if src == failing:
+            raise OSError("disk full")
+        real_fastcopy(src, dst)
+
+    monkeypatch.setattr(cleanup, "_fastcopy", fastcopy)
+
+    with pytest.raises(OSError, match="disk full"):
+        cleanup._run(actions, dry_run=False)
+
+    assert all(src.exists() for src in copies)
+
+
+def test_dry_run_touches_nothing(legacy):
+    actions, copies, _ = legacy
+
+    cleanup._run(actions, dry_run=True)
+
+    assert all(src.exists() for src in copies)
+    assert not any(dst.exists() for dst in copies.values())
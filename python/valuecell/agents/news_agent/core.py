@@ -1,14 +1,16 @@
 """News Agent Core Implementation."""
 
+import asyncio
 import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Dict, Optional
 
 from agno.agent import Agent
 from loguru import logger
 
 from valuecell.adapters.models import create_model_for_agent
-from valuecell.config.manager import get_config_manager
 from valuecell.core.agent.responses import streaming
 from valuecell.core.types import BaseAgent, StreamResponse
 
@@ -25,6 +27,17 @@ STRONG_PROCESS_INTRO_MARKERS = (
     "让我逐一解析",
     "让我看看",
 )
+_PROCESS_INTRO_PROBE_CHARS = 1200
+_PROCESS_INTRO_RE = re.compile(
+    "|".join(re.escape(marker) for marker in STRONG_PROCESS_INTRO_MARKERS)
+)
+
+
+# Single alternation so each line is matched in one pass of the regex engine.
+# Circled digits ①..⑩ are contiguous code points (U+2460..U+2469).
+_BODY_START_RE = re.compile(
+    r"^(?:\d+[\.、\)]|[①-⑩]|[-*]\s+|#{1,3}\s+|\*\*[^*]{4,}\*\*)"
+)
 
 
 def _looks_like_news_body_start(line: str) -> bool:
@@ -32,12 +45,8 @@ def _looks_like_news_body_start(line: str) -> bool:
     if not trimmed:
         return False
 
-    return bool(
-        re.match(r"^\d+[\.、\)]\s*", trimmed)
-        or re.match(r"^[①②③④⑤⑥⑦⑧⑨⑩]\s*", trimmed)
-        or re.match(r"^[-*]\s+", trimmed)
-        or re.match(r"^#{1,3}\s+", trimmed)
-        or re.match(r"^\*\*[^*]{4,}\*\*", trimmed)
+    return (
+        _BODY_START_RE.match(trimmed) is not None
         or "http://" in trimmed
         or "https://" in trimmed
     )
@@ -48,8 +57,8 @@ def _sanitize_news_output(content: str) -> str:
     if not text:
         return ""
 
-    prefix_probe = text[:1200]
-    has_process_intro = any(marker in prefix_probe for marker in STRONG_PROCESS_INTRO_MARKERS)
+    prefix_probe = text[:_PROCESS_INTRO_PROBE_CHARS]
+    has_process_intro = _PROCESS_INTRO_RE.search(prefix_probe) is not None
     if not has_process_intro:
         return text
 
@@ -67,15 +76,29 @@ def _sanitize_news_output(content: str) -> str:
 
 
 def _has_heading(content: str) -> bool:
-    first_non_empty = next((line.strip() for line in content.splitlines() if line.strip()), "")
-    return bool(first_non_empty and (first_non_empty.startswith("#") or first_non_empty.startswith("**")))
+    # The first non-whitespace characters start the first non-empty line
+    return content.lstrip().startswith(("#", "**"))
+
+
+# (epoch minute, year, month) of the last heading built
+_HEADING_CACHE: tuple[int, int, int] = (0, 0, 0)
+
+
+def _heading_year_month() -> tuple[int, int]:
+    global _HEADING_CACHE
+
+    epoch_minute = int(time.time() // 60)
+    if _HEADING_CACHE[0] != epoch_minute:
+        now = datetime.now()
+        _HEADING_CACHE = (epoch_minute, now.year, now.month)
+    return _HEADING_CACHE[1], _HEADING_CACHE[2]
 
 
 def _build_news_heading(query: str) -> str:
-    now = datetime.now()
+    year, month = _heading_year_month()
     if "科技" in query:
-        return f"## {now.year}年{now.month}月全球科技行业双循环格局与A股硬科技龙头价值重估"
-    return f"## {now.year}年{now.month}月实时新闻速览"
+        return f"## {year}年{month}月全球科技行业双循环格局与A股硬科技龙头价值重估"
+    return f"## {year}年{month}月实时新闻速览"
 
 
 def _format_news_output(content: str, query: str) -> str:
@@ -88,25 +111,117 @@ def _format_news_output(content: str, query: str) -> str:
     return f"{heading}\n\n{cleaned}".strip()
 
 
+# Above this size formatting runs in a worker thread to keep the loop responsive
+_OFFLOAD_FORMAT_CHARS = 32_000
+
+
+async def _format_news_output_async(content: str, query: str) -> str:
+    if len(content) > _OFFLOAD_FORMAT_CHARS:
+        return await asyncio.to_thread(_format_news_output, content, query)
+    return _format_news_output(content, query)
+
+
+class _NewsStreamFormatter:
+    """Incremental counterpart of ``_format_news_output`` for streamed content.
+
+    Chunks are held back only until the process-intro probe is resolved (or
+    the first news body line shows up); afterwards text is released as it
+    arrives, so the full body is never buffered or rescanned.
+    """
+
+    def __init__(self, query: str):
+        self._query = query
+        self._pending = ""
+        self._scan_pos = 0
+        self._decided = False
+        self._skip = False
+        self._started = False
+        self._tail = ""
+
+    def feed(self, chunk: str) -> str:
+        """Consume a content chunk and return the text ready to be emitted."""
+        if self._decided and not self._skip:
+            return self._release(chunk)
+
+        if not self._pending:
+            chunk = chunk.lstrip()
+        self._pending += chunk
+
+        if not self._decided:
+            probe = self._pending[:_PROCESS_INTRO_PROBE_CHARS]
+            if _PROCESS_INTRO_RE.search(probe) is not None:
+                self._decided = self._skip = True
+            else:
+                first_newline = self._pending.find("\n")
+                first_line_is_body = first_newline >= 0 and (
+                    _looks_like_news_body_start(self._pending[:first_newline])
+                )
+                if (
+                    first_line_is_body
+                    or len(self._pending) >= _PROCESS_INTRO_PROBE_CHARS
+                ):
+                    return self._release_pending(self._pending)
+                return ""
+
+        # Drop process-intro lines until the first news body line
+        while True:
+            newline = self._pending.find("\n", self._scan_pos)
+            if newline < 0:
+                return ""
+            if _looks_like_news_body_start(self._pending[self._scan_pos : newline]):
+                return self._release_pending(self._pending[self._scan_pos :].lstrip())
+            self._scan_pos = newline + 1
+
+    def finish(self) -> str:
+        """Flush whatever is still held back once the stream has ended."""
+        if self._decided and not self._skip:
+            return ""
+        return self._release_pending(_sanitize_news_output(self._pending))
+
+    def _release_pending(self, text: str) -> str:
+        self._pending = ""
+        self._decided = True
+        self._skip = False
+        return self._release(text)
+
+    def _release(self, text: str) -> str:
+        # Withhold trailing whitespace so the emitted body stays stripped
+        text = self._tail + text
+        body = text.rstrip()
+        self._tail = text[len(body) :]
+        if not body:
+            return ""
+        if not self._started:
+            self._started = True
+            if not _has_heading(body):
+                return f"{_build_news_heading(self._query)}\n\n{body}"
+        return body
+
+
+_NEWS_TOOLS = (web_search, get_breaking_news, get_financial_news)
+
+
+@lru_cache(maxsize=1)
+def _news_agent_model():
+    """Resolve the news agent's model once per process.
+
+    Call ``_news_agent_model.cache_clear()`` to pick up model config changes.
+    """
+    # Use create_model_for_agent to load agent-specific configuration
+    return create_model_for_agent("news_agent")
+
+
 class NewsAgent(BaseAgent):
     """News Agent for fetching and analyzing news."""
 
     def __init__(self, **kwargs):
         """Initialize the News Agent."""
         super().__init__(**kwargs)
-        # Load agent configuration
-        self.config_manager = get_config_manager()
-        self.agent_config = self.config_manager.get_agent_config("news_agent")
-
-        # Load tools based on configuration
-        available_tools = []
-
-        available_tools.extend([web_search, get_breaking_news, get_financial_news])
-
-        # Use create_model_for_agent to load agent-specific configuration
+        # agno's Agent keeps run and session state on itself, so each
+        # NewsAgent needs its own instance
         self.knowledge_news_agent = Agent(
-            model=create_model_for_agent("news_agent"),
-            tools=available_tools,
+            model=_news_agent_model(),
+            tools=list(_NEWS_TOOLS),
             instructions=NEWS_AGENT_INSTRUCTIONS,
         )
 
@@ -127,7 +242,7 @@ class NewsAgent(BaseAgent):
         try:
             has_final_content = False
             last_tool_result_text: str = ""
-            final_content_chunks: list[str] = []
+            formatter = _NewsStreamFormatter(query)
 
             response_stream = self.knowledge_news_agent.arun(
                 query,
@@ -138,7 +253,14 @@ class NewsAgent(BaseAgent):
             async for event in response_stream:
                 if event.event == "RunContent":
                     has_final_content = True
-                    final_content_chunks.append(str(event.content or ""))
+                    chunk = event.content
+                    if not chunk:
+                        continue
+                    text = formatter.feed(
+                        chunk if isinstance(chunk, str) else str(chunk)
+                    )
+                    if text:
+                        yield streaming.message_chunk(text)
                 elif event.event == "ToolCallStarted":
                     yield streaming.tool_call_started(
                         event.tool.tool_call_id, event.tool.tool_name
@@ -157,13 +279,13 @@ class NewsAgent(BaseAgent):
                     )
 
             if has_final_content:
-                final_content = _format_news_output("".join(final_content_chunks), query)
-                if final_content:
-                    yield streaming.message_chunk(final_content)
+                text = formatter.finish()
+                if text:
+                    yield streaming.message_chunk(text)
 
             if (not has_final_content) and last_tool_result_text:
                 yield streaming.message_chunk(
-                    _format_news_output(last_tool_result_text, query)
+                    await _format_news_output_async(last_tool_result_text, query)
                 )
 
             yield streaming.done()
@@ -184,12 +306,12 @@ class NewsAgent(BaseAgent):
             logger.debug("Starting news agent processing")
 
             # Get the complete response from the knowledge news agent
-            response = await self.knowledge_news_agent.arun(query)
+            response = await self.knowledge_news_agent.arun(query, stream=False)
 
             logger.info("News agent query completed successfully")
             logger.debug(f"Response length: {len(str(response.content))} characters")
 
-            return _format_news_output(str(response.content or ""), query)
+            return await _format_news_output_async(str(response.content or ""), query)
 
         except Exception as e:
             logger.error(f"Error in NewsAgent run: {e}")
@@ -0,0 +1,40 @@
+from valuecell.agents.news_agent.core import _format_news_output, _NewsStreamFormatter
+
+
+def _stream(text: str, query: str, chunk_size: int) -> list[str]:
+    formatter = _NewsStreamFormatter(query)
+    emitted = []
+    for idx in range(0, len(text), chunk_size):
+        emitted.append(formatter.feed(text[idx : idx + chunk_size]))
+    emitted.append(formatter.finish())
+    return emitted
+
+
+def test_stream_formatter_drops_process_intro():
+    text = (
+        "该用户询问了最新新闻。\n让我看看工具的回复。\n"
+        "1. 第一条新闻\nhttps://example.com/a\n2. 第二条新闻\n"
+    )
+    emitted = _stream(text, "news", 7)
+
+    assert "".join(emitted) == _format_news_output(text, "news")
+    assert "该用户询问了" not in "".join(emitted)
+
+
+def test_stream_formatter_releases_body_before_stream_ends():
+    text = "## 今日要闻\n\n" + "".join(f"{i}. 新闻条目\n" for i in range(1, 50))
+    emitted = _stream(text, "news", 16)
+
+    assert "".join(emitted) == _format_news_output(text, "news")
+    # Body is released chunk by chunk instead of in one final flush
+    assert sum(1 for part in emitted if part) > 1
+
+
+def test_stream_formatter_adds_heading_once():
+    text = "  这里是一段没有标题的新闻内容。\n更多细节。  \n"
+    emitted = _stream(text, "科技", 5)
+
+    joined = "".join(emitted)
+    assert joined == _format_news_output(text, "科技")
+    assert joined.startswith("## ")
+    assert joined.count("## ") == 1
@@ -0,0 +1,232 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from valuecell.agents.news_agent import tools
+
+
+@pytest.fixture(autouse=True)
+def _reset_loop_bound_state():
+    yield
+    tools._RSS_CLIENT = tools._RSS_CLIENT_LOOP = tools._RSS_CLIENT_GUARD = None
+    tools._breaking_lock = tools._breaking_lock_loop = None
+
+
+def _run_like_asyncio_run(coro):
+    # Mirror asyncio.run()'s shutdown without clearing the thread's current
+    # event loop, which other tests rely on
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def test_rss_client_is_closed_when_its_loop_finishes():
+    first = _run_like_asyncio_run(tools._get_rss_client())
+    assert first.is_closed
+
+    async def reuse():
+        client = await tools._get_rss_client()
+        assert await tools._get_rss_client() is client
+        return client
+
+    second = _run_like_asyncio_run(reuse())
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_close_rss_client_closes_on_running_loop():
+    client = await tools._get_rss_client()
+
+    await tools.close_rss_client()
+
+    assert client.is_closed
+    assert await tools._get_rss_client() is not client
+    await tools.close_rss_client()
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    """Stub every search provider; RSS always comes back empty."""
+    calls: list[str] = []
+    cancelled: list[str] = []
+    behaviours = {}
+
+    async def empty_rss(query: str) -> str:
+        return ""
+
+    async def fake_search(provider: str, query: str) -> str:
+        calls.append(provider)
+        delay, outcome = behaviours[provider]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(provider)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.delenv("WEB_SEARCH_PROVIDER", raising=False)
+    monkeypatch.setattr(tools, "_web_search_google_news_rss", empty_rss)
+    monkeypatch.setattr(tools, "_can_use_provider", lambda provider: True)
+    monkeypatch.setattr(tools, "_search_with_provider", fake_search)
+    monkeypatch.setattr(tools, "_provider_deadlines", {})
+    return behaviours, calls, cancelled
+
+
+@pytest.mark.asyncio
+async def test_web_search_returns_first_available_and_cancels_the_rest(providers):
+    behaviours, calls, cancelled = providers
+    behaviours[tools.SEARCH_PROVIDER_GOOGLE] = (5, "too slow")
+    behaviours[tools.SEARCH_PROVIDER_OPENROUTER] = (0.01, "openrouter news")
+    behaviours[tools.SEARCH_PROVIDER_SILICONFLOW] = (0, "无法联网检索")
+
+    assert await tools.web_search("AI") == "openrouter news"
+
+    assert set(calls) == {
+        tools.SEARCH_PROVIDER_GOOGLE,
+        tools.SEARCH_PROVIDER_OPENROUTER,
+        tools.SEARCH_PROVIDER_SILICONFLOW,
+    }
+    assert cancelled == [tools.SEARCH_PROVIDER_GOOGLE]
+    assert set(tools._provider_deadlines) == {tools.SEARCH_PROVIDER_SILICONFLOW}
+
+
+@pytest.mark.asyncio
+async def test_web_search_skips_unavailable_provider_for_ttl(providers):
+    behaviours, calls, _ = providers
+    behaviours[tools.SEARCH_PROVIDER_GOOGLE] = (0, RuntimeError("boom"))
+    behaviours[tools.SEARCH_PROVIDER_OPENROUTER] = (0.01, "openrouter news")
+    behaviours[tools.SEARCH_PROVIDER_SILICONFLOW] = (0.01, "siliconflow news")
+
+    assert await tools.web_search("AI") in {"openrouter news", "siliconflow news"}
+    deadline = tools._provider_deadlines[tools.SEARCH_PROVIDER_GOOGLE]
+    remaining = deadline - time.monotonic()
+    assert 0 < remaining <= tools.PROVIDER_UNAVAILABLE_TTL_SECONDS
+
+    # Within the TTL the failed provider is not queried at all
+    calls.clear()
+    await tools.web_search("AI")
+    assert tools.SEARCH_PROVIDER_GOOGLE not in calls
+
+    # Once the TTL has passed it is tried again, and success clears the mark
+    tools._provider_deadlines[tools.SEARCH_PROVIDER_GOOGLE] = time.monotonic() - 1
+    behaviours[tools.SEARCH_PROVIDER_GOOGLE] = (0, "google news")
+    calls.clear()
+    assert await tools.web_search("AI") == "google news"
+    assert tools.SEARCH_PROVIDER_GOOGLE in calls
+    assert tools.SEARCH_PROVIDER_GOOGLE not in tools._provider_deadlines
+
+
+@pytest.mark.asyncio
+async def test_web_search_reports_unavailable_when_every_provider_fails(providers):
+    behaviours, _, _ = providers
+    for provider in (
+        tools.SEARCH_PROVIDER_GOOGLE,
+        tools.SEARCH_PROVIDER_OPENROUTER,
+        tools.SEARCH_PROVIDER_SILICONFLOW,
+    ):
+        behaviours[provider] = (0, RuntimeError("down"))
+
+    assert await tools.web_search("AI") == tools.SEARCH_UNAVAILABLE_MESSAGE
+    assert len(tools._provider_deadlines) == 3
+
+
+@pytest.mark.asyncio
+async def test_breaking_news_is_cached_for_ttl(monkeypatch):
+    results = iter([tools.SEARCH_UNAVAILABLE_MESSAGE, "first", "second"])
+    queries: list[str] = []
+
+    async def fake_web_search(query: str) -> str:
+        queries.append(query)
+        return next(results)
+
+    monkeypatch.setattr(tools, "web_search", fake_web_search)
+    monkeypatch.setattr(tools, "_breaking_cache", None)
+
+    # The unavailable message is never cached
+    assert await tools.get_breaking_news() == tools.SEARCH_UNAVAILABLE_MESSAGE
+    assert await tools.get_breaking_news() == "first"
+    assert await tools.get_breaking_news() == "first"
+    assert queries == [tools.BREAKING_NEWS_QUERY] * 2
+
+    # An expired entry triggers a fresh search
+    cached_at, bucket, content = tools._breaking_cache
+    expired = cached_at - tools.BREAKING_NEWS_TTL_SECONDS
+    monkeypatch.setattr(tools, "_breaking_cache", (expired, bucket, content))
+    assert await tools.get_breaking_news() == "second"
+    assert len(queries) == 3
+
+
+def test_breaking_news_lock_works_across_event_loops(monkeypatch):
+    queries: list[str] = []
+
+    async def slow_web_search(query: str) -> str:
+        queries.append(query)
+        await asyncio.sleep(0.01)
+        return "news"
+
+    async def concurrent_calls():
+        return await asyncio.gather(
+            tools.get_breaking_news(), tools.get_breaking_news()
+        )
+
+    monkeypatch.setattr(tools, "web_search", slow_web_search)
+    for _ in range(2):
+        monkeypatch.setattr(tools, "_breaking_cache", None)
+        # The second caller waits on the lock, binding it to this loop
+        assert _run_like_asyncio_run(concurrent_calls()) == ["news", "news"]
+
+    assert len(queries) == 2
+
+
+_RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<title>Google News</title>
+<item><title></title><link>https://example.com/untitled</link></item>
+<item>
+  <title>First headline</title>
+  <link>https://example.com/1</link>
+  <pubDate>Mon, 06 Jan 2025 08:00:00 GMT</pubDate>
+  <source url="https://reuters.com">Reuters</source>
+</item>
+<item><title>Second headline</title><link>https://example.com/2</link></item>
+<item><title>Third headline</title><source>Bloomberg</source></item>
+<item><title>Fourth headline</title></item>
+</channel></rss>
+"""
+
+
+@pytest.mark.asyncio
+async def test_google_news_rss_parses_up_to_limit(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=_RSS_FEED)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_client() -> httpx.AsyncClient:
+        return client
+
+    monkeypatch.setattr(tools, "_get_rss_client", get_client)
+    try:
+        result = await tools._web_search_google_news_rss("AI 芯片", limit=3)
+    finally:
+        await client.aclose()
+
+    assert requests[0].url.params["q"] == "AI 芯片"
+    # The untitled item is skipped without counting toward the limit
+    assert result.split("\n\n") == [
+        "**First headline**\n"
+        "Reuters | Mon, 06 Jan 2025 08:00:00 GMT\n"
+        "https://example.com/1",
+        "**Second headline**\nhttps://example.com/2",
+        "**Third headline**\nBloomberg",
+    ]
@@ -1,15 +1,25 @@
 """News-related tools for the News Agent."""
 
+import asyncio
+import importlib.util
+import io
 import os
+import re
+import time
 from datetime import datetime
-from typing import Optional
+from typing import AsyncGenerator, Optional
 from urllib.parse import quote_plus
-from xml.etree import ElementTree
 
 import httpx
 from agno.agent import Agent
 from loguru import logger
 
+try:
+    # C-level parser; fall back to the stdlib when lxml is not installed
+    from lxml import etree as rss_etree
+except ImportError:
+    from xml.etree import ElementTree as rss_etree
+
 from valuecell.adapters.models import create_model
 
 SEARCH_PROVIDER_GOOGLE = "google"
@@ -24,6 +34,35 @@ SEARCH_UNAVAILABLE_MARKERS = (
     "cannot access real-time news",
     "can't access real-time news",
 )
+_UNAVAILABLE_RE = re.compile(
+    "|".join(re.escape(marker.lower()) for marker in SEARCH_UNAVAILABLE_MARKERS)
+)
+
+SEARCH_UNAVAILABLE_MESSAGE = (
+    "实时新闻检索服务暂不可用。请稍后重试，或切换可用的搜索模型提供商后再查询。"
+)
+
+PROVIDER_UNAVAILABLE_TTL_SECONDS = 30.0
+
+# provider -> monotonic deadline until which the provider is skipped
+_provider_deadlines: dict[str, float] = {}
+
+BREAKING_NEWS_QUERY = "breaking news urgent updates today"
+BREAKING_NEWS_TTL_SECONDS = 60.0
+
+# Shared client for the RSS endpoint, bound to the event loop that created it.
+# The guard is an async generator started on that loop whose cleanup closes
+# the client; asyncio.run() finalizes async generators before closing its
+# loop, so the client is closed while its transports can still be torn down.
+_RSS_CLIENT: httpx.AsyncClient | None = None
+_RSS_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+_RSS_CLIENT_GUARD: AsyncGenerator[None, None] | None = None
+
+# (monotonic timestamp, date bucket, content) of the last breaking news fetch
+_breaking_cache: tuple[float, str, str] | None = None
+# asyncio.Lock binds to the loop it first waits on, so keep one per loop
+_breaking_lock: asyncio.Lock | None = None
+_breaking_lock_loop: asyncio.AbstractEventLoop | None = None
 
 
 def _active_search_provider() -> str:
@@ -50,17 +89,70 @@ def _build_provider_order() -> list[str]:
     ]
 
     if requested in all_providers:
-        return [requested, *[p for p in all_providers if p != requested]]
+        all_providers = [requested, *[p for p in all_providers if p != requested]]
+
+    now = time.monotonic()
+    return [p for p in all_providers if _provider_deadlines.get(p, 0.0) <= now]
 
-    return all_providers
+
+def _mark_provider_unavailable(provider: str) -> None:
+    _provider_deadlines[provider] = time.monotonic() + PROVIDER_UNAVAILABLE_TTL_SECONDS
 
 
 def _build_search_unavailable_message(query: str) -> str:
     logger.warning("News web search unavailable for query: {}", query)
-    return (
-        "实时新闻检索服务暂不可用。"
-        "请稍后重试，或切换可用的搜索模型提供商后再查询。"
+    return SEARCH_UNAVAILABLE_MESSAGE
+
+
+async def _close_with_loop(
+    client: httpx.AsyncClient,
+) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+async def _get_rss_client() -> httpx.AsyncClient:
+    """Return the shared RSS client, creating it for the running loop if needed."""
+    global _RSS_CLIENT, _RSS_CLIENT_LOOP, _RSS_CLIENT_GUARD
+
+    loop = asyncio.get_running_loop()
+    if (
+        _RSS_CLIENT is not None
+        and not _RSS_CLIENT.is_closed
+        and _RSS_CLIENT_LOOP is loop
+    ):
+        return _RSS_CLIENT
+
+    await close_rss_client()
+    client = httpx.AsyncClient(
+        # HTTP/2 requires the optional `h2` package
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=10.0,
+        follow_redirects=True,
     )
+    guard = _close_with_loop(client)
+    await anext(guard)
+    _RSS_CLIENT, _RSS_CLIENT_LOOP, _RSS_CLIENT_GUARD = client, loop, guard
+    return client
+
+
+async def close_rss_client() -> None:
+    """Close the shared RSS client, if one was created."""
+    global _RSS_CLIENT, _RSS_CLIENT_LOOP, _RSS_CLIENT_GUARD
+
+    guard, loop = _RSS_CLIENT_GUARD, _RSS_CLIENT_LOOP
+    _RSS_CLIENT = _RSS_CLIENT_LOOP = _RSS_CLIENT_GUARD = None
+    if guard is None or loop.is_closed():
+        # A finished asyncio.run() loop has already finalized the guard
+        return
+    if loop is asyncio.get_running_loop():
+        await guard.aclose()
+    else:
+        # Transports can only be torn down on the loop that owns them
+        asyncio.run_coroutine_threadsafe(guard.aclose(), loop)
 
 
 async def _web_search_google_news_rss(query: str, limit: int = 8) -> str:
@@ -70,20 +162,23 @@ async def _web_search_google_news_rss(query: str, limit: int = 8) -> str:
         f"?q={encoded_query}&hl=zh-CN&gl=CN&ceid=CN:zh-Hans"
     )
 
-    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        content = resp.text
-
-    root = ElementTree.fromstring(content)
-    items = root.findall("./channel/item")
+    client = await _get_rss_client()
+    resp = await client.get(url)
+    resp.raise_for_status()
+    content = resp.content
 
+    # Stream-parse and stop once enough items are collected instead of
+    # materializing the whole feed DOM.
     results: list[str] = []
-    for item in items[:limit]:
+    for _, item in rss_etree.iterparse(io.BytesIO(content), events=("end",)):
+        if item.tag != "item":
+            continue
+
         title = (item.findtext("title") or "").strip()
         link = (item.findtext("link") or "").strip()
         pub_date = (item.findtext("pubDate") or "").strip()
         source = (item.findtext("source") or "").strip()
+        item.clear()
 
         if not title:
             continue
@@ -96,11 +191,13 @@ async def _web_search_google_news_rss(query: str, limit: int = 8) -> str:
             meta_parts.append(pub_date)
 
         if meta_parts:
-            line += f"\n{ ' | '.join(meta_parts) }"
+            line += f"\n{' | '.join(meta_parts)}"
         if link:
             line += f"\n{link}"
 
         results.append(line)
+        if len(results) >= limit:
+            break
 
     if not results:
         return ""
@@ -113,7 +210,7 @@ def _looks_like_unavailable_response(content: str) -> bool:
     if not normalized:
         return True
 
-    return any(marker.lower() in normalized for marker in SEARCH_UNAVAILABLE_MARKERS)
+    return _UNAVAILABLE_RE.search(normalized) is not None
 
 
 async def _run_agent_search(model, query: str) -> str:
@@ -135,6 +232,10 @@ async def web_search(query: str) -> str:
     Returns:
         A summary of the top search results.
     """
+    # Google News RSS first; if it yields nothing, every configured model
+    # provider is queried concurrently and the first available answer wins.
+    # (Kept out of the docstring, which agno sends to the LLM as the tool
+    # description.)
     try:
         rss_content = await _web_search_google_news_rss(query)
         if not _looks_like_unavailable_response(rss_content):
@@ -143,29 +244,52 @@ async def web_search(query: str) -> str:
     except Exception as exc:
         logger.warning("Google News RSS search failed: {}", exc)
 
-    for provider in _build_provider_order():
-        if not _can_use_provider(provider):
-            continue
-
-        try:
-            if provider == SEARCH_PROVIDER_GOOGLE:
-                content = await _web_search_google(query)
-                if not _looks_like_unavailable_response(content):
-                    return content
-            if provider == SEARCH_PROVIDER_OPENROUTER:
-                content = await _web_search_openrouter(query)
-                if not _looks_like_unavailable_response(content):
-                    return content
-            if provider == SEARCH_PROVIDER_SILICONFLOW:
-                content = await _web_search_siliconflow(query)
-                if not _looks_like_unavailable_response(content):
-                    return content
-        except Exception as exc:
-            logger.warning("{} web search failed: {}", provider, exc)
+    # Race every usable provider and keep the first available answer
+    tasks: dict[asyncio.Task, str] = {
+        asyncio.create_task(_search_with_provider(provider, query)): provider
+        for provider in _build_provider_order()
+        if _can_use_provider(provider)
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=list(tasks).index):
+                provider = tasks[task]
+                exc = task.exception()
+                if exc is not None:
+                    logger.warning("{} web search failed: {}", provider, exc)
+                    _mark_provider_unavailable(provider)
+                    continue
+
+                content = task.result()
+                if _looks_like_unavailable_response(content):
+                    _mark_provider_unavailable(provider)
+                    continue
+
+                _provider_deadlines.pop(provider, None)
+                return content
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
     return _build_search_unavailable_message(query)
 
 
+async def _search_with_provider(provider: str, query: str) -> str:
+    if provider == SEARCH_PROVIDER_GOOGLE:
+        return await _web_search_google(query)
+    if provider == SEARCH_PROVIDER_OPENROUTER:
+        return await _web_search_openrouter(query)
+    if provider == SEARCH_PROVIDER_SILICONFLOW:
+        return await _web_search_siliconflow(query)
+    raise ValueError(f"Unknown search provider: {provider}")
+
+
 async def _web_search_google(query: str) -> str:
     """Search Google for the given query and return a summary of the top results.
 
@@ -206,18 +330,51 @@ async def _web_search_siliconflow(query: str) -> str:
     return await _run_agent_search(model, enhanced_query)
 
 
+def _get_breaking_lock() -> asyncio.Lock:
+    global _breaking_lock, _breaking_lock_loop
+
+    loop = asyncio.get_running_loop()
+    if _breaking_lock is None or _breaking_lock_loop is not loop:
+        _breaking_lock, _breaking_lock_loop = asyncio.Lock(), loop
+    return _breaking_lock
+
+
+def _cached_breaking_news(date_bucket: str) -> Optional[str]:
+    if _breaking_cache is None:
+        return None
+    cached_at, cached_bucket, content = _breaking_cache
+    if cached_bucket != date_bucket:
+        return None
+    if time.monotonic() - cached_at >= BREAKING_NEWS_TTL_SECONDS:
+        return None
+    return content
+
+
 async def get_breaking_news() -> str:
     """Get breaking news and urgent updates.
 
     Returns:
         Formatted string containing breaking news
     """
-    try:
-        search_query = "breaking news urgent updates today"
-        logger.info("Fetching breaking news")
+    global _breaking_cache
 
-        news_content = await web_search(search_query)
-        return news_content
+    # Results are cached for a short TTL so bursts of calls share one search
+    try:
+        date_bucket = datetime.now().strftime("%Y-%m-%d")
+        cached = _cached_breaking_news(date_bucket)
+        if cached is not None:
+            return cached
+
+        async with _get_breaking_lock():
+            cached = _cached_breaking_news(date_bucket)
+            if cached is not None:
+                return cached
+
+            logger.info("Fetching breaking news")
+            news_content = await web_search(BREAKING_NEWS_QUERY)
+            if news_content != SEARCH_UNAVAILABLE_MESSAGE:
+                _breaking_cache = (time.monotonic(), date_bucket, news_content)
+            return news_content
 
     except Exception as exc:
         logger.error("Error fetching breaking news: {}", exc)
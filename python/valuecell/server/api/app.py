@@ -7,9 +7,11 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from loguru import logger
 
 from ...adapters.assets import get_adapter_manager
+from ...agents.news_agent.tools import close_rss_client
 from ...utils.env import ensure_system_env_dir, get_system_env_path
 from ..config.settings import get_settings
 from ..db import init_database
@@ -142,6 +144,7 @@ def create_app() -> FastAPI:
         yield
         # Shutdown
         logger.info("ValueCell Server shutting down...")
+        await close_rss_client()
 
     app = FastAPI(
         title="ValueCell Server API",
@@ -175,6 +178,10 @@ def _add_middleware(app: FastAPI, settings) -> None:
         allow_headers=["*"],
     )
 
+    # Compress larger JSON payloads (e.g. batched news deliveries); Starlette
+    # skips text/event-stream responses so agent streams are unaffected
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Custom logging middleware removed
 
 
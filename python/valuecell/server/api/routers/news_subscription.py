@@ -1,5 +1,7 @@
 """News subscription API routes for scheduled personalized delivery."""
 
+from typing import Any, Dict, Type, TypeVar
+
 from fastapi import APIRouter, HTTPException, Path
 
 from ...services.news_subscription_service import (
@@ -16,6 +18,17 @@ from ..schemas.news_subscription import (
     UpdateNewsSubscriptionRequest,
 )
 
+_ModelT = TypeVar("_ModelT", NewsSubscriptionData, NewsDeliveryData)
+
+
+def _from_service(model: Type[_ModelT], row: Dict[str, Any]) -> _ModelT:
+    """Build response data from a service-produced dict without validation.
+
+    Rows come from our own service, not from the client, so the validator
+    pipeline is skipped.
+    """
+    return model.model_construct(**row)
+
 
 def create_news_subscription_router() -> APIRouter:
     """Create router for personalized news subscription APIs."""
@@ -25,7 +38,7 @@ def create_news_subscription_router() -> APIRouter:
     @router.get("", response_model=SuccessResponse[NewsSubscriptionListData])
     async def list_subscriptions():
         rows = service.list_subscriptions(DEFAULT_USER_ID)
-        items = [NewsSubscriptionData(**row) for row in rows]
+        items = [_from_service(NewsSubscriptionData, row) for row in rows]
         return SuccessResponse.create(
             data=NewsSubscriptionListData(subscriptions=items, count=len(items)),
             msg="News subscriptions retrieved successfully",
@@ -113,7 +126,7 @@ def create_news_subscription_router() -> APIRouter:
     async def deliver_due_subscriptions():
         deliveries = await service.deliver_due_subscriptions(user_id=DEFAULT_USER_ID)
         result = NewsDeliveryBatchData(
-            deliveries=[NewsDeliveryData(**item) for item in deliveries],
+            deliveries=[_from_service(NewsDeliveryData, item) for item in deliveries],
             delivered_count=len(deliveries),
         )
         return SuccessResponse.create(
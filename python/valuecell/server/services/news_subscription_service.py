@@ -3,28 +3,60 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from datetime import datetime, timedelta, timezone
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
+import orjson
 from loguru import logger
 
 from valuecell.agents.news_agent.tools import web_search
-from valuecell.utils.env import ensure_system_env_dir
+from valuecell.utils.db import resolve_db_path
+from valuecell.utils.env import get_system_env_dir
 
 DEFAULT_USER_ID = "default_user"
+# Legacy JSON store, imported into SQLite once and then renamed
 SUBSCRIPTIONS_FILE = "news_subscriptions.json"
+# Upper bound on concurrent web searches when delivering due subscriptions
+DEFAULT_MAX_CONCURRENCY = 4
+
+_COLUMN_NAMES = (
+    "id",
+    "user_id",
+    "name",
+    "keywords_json",
+    "interval_minutes",
+    "enabled",
+    "realtime_tracking",
+    "last_run_at",
+    "next_run_at",
+    "created_at",
+    "updated_at",
+)
+_COLUMNS = ", ".join(_COLUMN_NAMES)
 
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _to_iso(value: datetime) -> str:
-    return value.isoformat()
+def _to_epoch(value: datetime) -> int:
+    return int(value.timestamp())
+
+
+# Rows are re-read on every list/poll with mostly unchanged timestamps, and
+# datetimes are immutable, so conversions can be shared.
+@lru_cache(maxsize=4096)
+def _from_epoch(value: Optional[int]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, timezone.utc)
 
 
 def _from_iso(value: Optional[str]) -> Optional[datetime]:
@@ -37,52 +69,275 @@ def _from_iso(value: Optional[str]) -> Optional[datetime]:
 
 
 def _clean_keywords(keywords: List[str]) -> List[str]:
+    seen: set[str] = set()
     unique_keywords: list[str] = []
     for keyword in keywords:
         trimmed = keyword.strip()
-        if trimmed and trimmed not in unique_keywords:
+        if trimmed and trimmed not in seen:
+            seen.add(trimmed)
             unique_keywords.append(trimmed)
     return unique_keywords
 
 
+def _dump_keywords(keywords: List[str]) -> str:
+    return orjson.dumps(keywords).decode()
+
+
+# Stored keyword JSON is immutable per row, so repeated polls of the same
+# subscription reuse one decoded, sorted clause instead of re-parsing it.
+@lru_cache(maxsize=1024)
+def _keyword_clause(keywords_json: str) -> str:
+    # Sorted so identical keyword sets produce identical queries
+    return " OR ".join(sorted(orjson.loads(keywords_json)))
+
+
+def _row_to_subscription(row: sqlite3.Row | Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "user_id": row["user_id"],
+        "name": row["name"],
+        "keywords": orjson.loads(row["keywords_json"]),
+        "interval_minutes": row["interval_minutes"],
+        "enabled": bool(row["enabled"]),
+        "realtime_tracking": bool(row["realtime_tracking"]),
+        "last_run_at": _from_epoch(row["last_run_at"]),
+        "next_run_at": _from_epoch(row["next_run_at"]),
+        "created_at": _from_epoch(row["created_at"]),
+        "updated_at": _from_epoch(row["updated_at"]),
+    }
+
+
+_MARK_DELIVERED_SQL = (
+    "UPDATE news_subscriptions SET last_run_at = ?, next_run_at = ?, "
+    "updated_at = ? WHERE id = ? AND user_id = ?"
+)
+
+
+def _mark_delivered_params(row: sqlite3.Row, now_epoch: int) -> tuple:
+    next_run_epoch = now_epoch + int(row["interval_minutes"]) * 60
+    return now_epoch, next_run_epoch, now_epoch, row["id"], row["user_id"]
+
+
+def _delivery(row: sqlite3.Row, content: str, delivered_at: datetime) -> Dict[str, Any]:
+    return {
+        "subscription_id": row["id"],
+        "subscription_name": row["name"],
+        "keywords": orjson.loads(row["keywords_json"]),
+        "delivered_at": delivered_at,
+        "content": content,
+    }
+
+
 class NewsSubscriptionService:
-    """Manage news subscriptions and deliver due updates."""
+    """Manage news subscriptions and deliver due updates.
 
-    def __init__(self, storage_path: Optional[Path] = None):
-        base_dir = ensure_system_env_dir()
-        self.storage_path = storage_path or (base_dir / SUBSCRIPTIONS_FILE)
+    Subscriptions live in the shared SQLite database (see `resolve_db_path`),
+    with timestamps stored as epoch seconds so due checks are indexed integer
+    comparisons. Writes go through one connection guarded by ``_lock``; reads
+    use a second, query-only connection under ``_read_lock`` so that, with
+    WAL, listing and due polls never wait on a writer.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        legacy_path: Optional[Path] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.db_path = db_path or resolve_db_path()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.legacy_path = legacy_path or (
+            Path(get_system_env_dir()) / SUBSCRIPTIONS_FILE
+        )
+        self.max_concurrency = max_concurrency
         self._lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._read_lock = Lock()
+        self._read_conn: Optional[sqlite3.Connection] = None
+        self._list_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
 
-    def _load_data(self) -> Dict[str, Any]:
-        with self._lock:
-            if not self.storage_path.exists():
-                return {"subscriptions": []}
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, creating the schema on first use.
 
-            try:
-                content = self.storage_path.read_text(encoding="utf-8")
-                parsed = json.loads(content)
-                if isinstance(parsed, dict) and isinstance(
-                    parsed.get("subscriptions"), list
-                ):
-                    return parsed
-            except Exception as exc:
-                logger.warning("Failed to load news subscriptions: {}", exc)
-
-            return {"subscriptions": []}
-
-    def _save_data(self, data: Dict[str, Any]) -> None:
+        Callers must hold ``self._lock``.
+        """
+        if self._conn is not None:
+            return self._conn
+
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS news_subscriptions (
+                id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                keywords_json TEXT NOT NULL,
+                interval_minutes INTEGER NOT NULL,
+                enabled INTEGER NOT NULL DEFAULT 1,
+                realtime_tracking INTEGER NOT NULL DEFAULT 1,
+                last_run_at INTEGER,
+                next_run_at INTEGER,
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_news_subscriptions_user_next "
+            "ON news_subscriptions(user_id, next_run_at) WHERE enabled = 1"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_news_subscriptions_user_updated "
+            "ON news_subscriptions(user_id, updated_at)"
+        )
+        self._conn = conn
+        self._import_legacy_file(conn)
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return the read-only connection.
+
+        Callers must hold ``self._read_lock``.
+        """
+        if self._read_conn is not None:
+            return self._read_conn
+
+        # The writer owns schema creation and the legacy import
         with self._lock:
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            self.storage_path.write_text(
-                json.dumps(data, ensure_ascii=False, indent=2),
-                encoding="utf-8",
+            self._connection()
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=ON")
+        self._read_conn = conn
+        return conn
+
+    def _import_legacy_file(self, conn: sqlite3.Connection) -> None:
+        """Move subscriptions from the old JSON file into SQLite, once."""
+        # One open instead of an exists() probe followed by a read
+        try:
+            content = self.legacy_path.read_bytes()
+        except FileNotFoundError:
+            return
+
+        try:
+            parsed = orjson.loads(content)
+            rows = parsed.get("subscriptions", []) if isinstance(parsed, dict) else []
+            conn.execute("BEGIN")
+            for row in rows:
+                now = _utc_now()
+                created_at = _from_iso(row.get("created_at")) or now
+                updated_at = _from_iso(row.get("updated_at")) or created_at
+                last_run_at = _from_iso(row.get("last_run_at"))
+                next_run_at = _from_iso(row.get("next_run_at"))
+                conn.execute(
+                    f"INSERT OR IGNORE INTO news_subscriptions ({_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        row["id"],
+                        row.get("user_id", DEFAULT_USER_ID),
+                        row.get("name", ""),
+                        _dump_keywords(row.get("keywords", [])),
+                        int(row.get("interval_minutes", 60)),
+                        int(bool(row.get("enabled", True))),
+                        int(bool(row.get("realtime_tracking", True))),
+                        _to_epoch(last_run_at) if last_run_at else None,
+                        _to_epoch(next_run_at) if next_run_at else None,
+                        _to_epoch(created_at),
+                        _to_epoch(updated_at),
+                    ),
+                )
+            conn.execute("COMMIT")
+            os.replace(self.legacy_path, self.legacy_path.with_suffix(".json.migrated"))
+            logger.info("Imported {} news subscriptions into SQLite", len(rows))
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning("Failed to import legacy news subscriptions: {}", exc)
+
+    @contextmanager
+    def batch(self) -> Iterator[sqlite3.Connection]:
+        """Run the statements issued in the block as a single transaction.
+
+        Holds ``self._lock`` for the whole block, so it is sync-only: never
+        await inside it, and use the yielded connection directly rather than
+        the public methods (which take the lock themselves). Commits once on
+        exit, or rolls back if the block raises.
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _fetch_one(self, subscription_id: str, user_id: str) -> Optional[sqlite3.Row]:
+        return (
+            self._connection()
+            .execute(
+                f"SELECT {_COLUMNS} FROM news_subscriptions "
+                "WHERE id = ? AND user_id = ?",
+                (subscription_id, user_id),
             )
+            .fetchone()
+        )
 
-    def list_subscriptions(self, user_id: str = DEFAULT_USER_ID) -> List[Dict[str, Any]]:
-        data = self._load_data()
-        rows = [s for s in data["subscriptions"] if s.get("user_id") == user_id]
-        rows.sort(key=lambda row: row.get("updated_at", ""), reverse=True)
-        return rows
+    def _iter_due_rows(self, user_id: str, now_epoch: int) -> Iterator[sqlite3.Row]:
+        """Yield due rows straight from the cursor, unsorted.
+
+        Callers must hold ``self._read_lock`` while consuming the iterator.
+        """
+        yield from self._reader().execute(
+            f"SELECT {_COLUMNS} FROM news_subscriptions "
+            "WHERE user_id = ? AND enabled = 1 "
+            "AND (next_run_at IS NULL OR next_run_at <= ?)",
+            (user_id, now_epoch),
+        )
+
+    def _data_version(self) -> int:
+        """Return a value that changes whenever another connection commits.
+
+        Every write goes through the writer connection, so this covers our
+        own writes as well. Callers must hold ``self._read_lock``.
+        """
+        (data_version,) = self._reader().execute("PRAGMA data_version").fetchone()
+        return data_version
+
+    def list_subscriptions(
+        self, user_id: str = DEFAULT_USER_ID
+    ) -> List[Dict[str, Any]]:
+        """List subscriptions, newest first.
+
+        Results are cached until the database changes; the returned dicts are
+        shared and must not be mutated.
+        """
+        with self._read_lock:
+            key = self._data_version()
+            cached = self._list_cache.get(user_id)
+            if cached is not None and cached[0] == key:
+                return list(cached[1])
+
+            rows = (
+                self._reader()
+                .execute(
+                    f"SELECT {_COLUMNS} FROM news_subscriptions WHERE user_id = ? "
+                    "ORDER BY updated_at DESC, rowid DESC",
+                    (user_id,),
+                )
+                .fetchall()
+            )
+            subscriptions = [_row_to_subscription(row) for row in rows]
+            self._list_cache[user_id] = (key, subscriptions)
+        return list(subscriptions)
 
     def create_subscription(
         self,
@@ -97,26 +352,28 @@ class NewsSubscriptionService:
         if not cleaned_keywords:
             raise ValueError("keywords cannot be empty")
 
-        now = _utc_now()
-        next_run_at = now + timedelta(minutes=interval_minutes)
-        row = {
-            "id": str(uuid4()),
-            "user_id": user_id,
-            "name": name.strip(),
-            "keywords": cleaned_keywords,
-            "interval_minutes": interval_minutes,
-            "enabled": enabled,
-            "realtime_tracking": realtime_tracking,
-            "last_run_at": None,
-            "next_run_at": _to_iso(next_run_at) if enabled else None,
-            "created_at": _to_iso(now),
-            "updated_at": _to_iso(now),
-        }
-
-        data = self._load_data()
-        data["subscriptions"].append(row)
-        self._save_data(data)
-        return row
+        now_epoch = _to_epoch(_utc_now())
+        values = (
+            str(uuid4()),
+            user_id,
+            name.strip(),
+            _dump_keywords(cleaned_keywords),
+            interval_minutes,
+            int(enabled),
+            int(realtime_tracking),
+            None,
+            now_epoch + interval_minutes * 60 if enabled else None,
+            now_epoch,
+            now_epoch,
+        )
+        with self._lock:
+            self._connection().execute(
+                f"INSERT INTO news_subscriptions ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            )
+        # The inserted values are the row; no need to read it back
+        return _row_to_subscription(dict(zip(_COLUMN_NAMES, values)))
 
     def update_subscription(
         self,
@@ -128,133 +385,134 @@ class NewsSubscriptionService:
         realtime_tracking: Optional[bool] = None,
         user_id: str = DEFAULT_USER_ID,
     ) -> Optional[Dict[str, Any]]:
-        data = self._load_data()
-        target: Optional[Dict[str, Any]] = None
-        for row in data["subscriptions"]:
-            if row.get("id") == subscription_id and row.get("user_id") == user_id:
-                target = row
-                break
-
-        if target is None:
-            return None
-
-        if name is not None:
-            target["name"] = name.strip()
+        cleaned_keywords: Optional[List[str]] = None
         if keywords is not None:
             cleaned_keywords = _clean_keywords(keywords)
             if not cleaned_keywords:
                 raise ValueError("keywords cannot be empty")
-            target["keywords"] = cleaned_keywords
-        if interval_minutes is not None:
-            target["interval_minutes"] = interval_minutes
-        if enabled is not None:
-            target["enabled"] = enabled
-        if realtime_tracking is not None:
-            target["realtime_tracking"] = realtime_tracking
 
-        now = _utc_now()
-        target["updated_at"] = _to_iso(now)
-
-        is_enabled = bool(target.get("enabled", True))
-        current_next = _from_iso(target.get("next_run_at"))
-        if not is_enabled:
-            target["next_run_at"] = None
-        elif current_next is None or current_next < now:
-            target["next_run_at"] = _to_iso(
-                now + timedelta(minutes=int(target["interval_minutes"]))
+        with self._lock:
+            current = self._fetch_one(subscription_id, user_id)
+            if current is None:
+                return None
+
+            target = dict(current)
+            if name is not None:
+                target["name"] = name.strip()
+            if cleaned_keywords is not None:
+                target["keywords_json"] = _dump_keywords(cleaned_keywords)
+            if interval_minutes is not None:
+                target["interval_minutes"] = interval_minutes
+            if enabled is not None:
+                target["enabled"] = int(enabled)
+            if realtime_tracking is not None:
+                target["realtime_tracking"] = int(realtime_tracking)
+
+            now_epoch = _to_epoch(_utc_now())
+            target["updated_at"] = now_epoch
+
+            current_next = target["next_run_at"]
+            if not target["enabled"]:
+                target["next_run_at"] = None
+            elif current_next is None or current_next < now_epoch:
+                target["next_run_at"] = now_epoch + int(target["interval_minutes"]) * 60
+
+            self._connection().execute(
+                "UPDATE news_subscriptions SET name = ?, keywords_json = ?, "
+                "interval_minutes = ?, enabled = ?, realtime_tracking = ?, "
+                "next_run_at = ?, updated_at = ? WHERE id = ? AND user_id = ?",
+                (
+                    target["name"],
+                    target["keywords_json"],
+                    target["interval_minutes"],
+                    target["enabled"],
+                    target["realtime_tracking"],
+                    target["next_run_at"],
+                    target["updated_at"],
+                    subscription_id,
+                    user_id,
+                ),
             )
-
-        self._save_data(data)
-        return target
+        return _row_to_subscription(target)
 
     def delete_subscription(
         self, subscription_id: str, user_id: str = DEFAULT_USER_ID
     ) -> bool:
-        data = self._load_data()
-        before = len(data["subscriptions"])
-        data["subscriptions"] = [
-            row
-            for row in data["subscriptions"]
-            if not (row.get("id") == subscription_id and row.get("user_id") == user_id)
-        ]
-        changed = len(data["subscriptions"]) != before
-        if changed:
-            self._save_data(data)
-        return changed
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM news_subscriptions WHERE id = ? AND user_id = ?",
+                (subscription_id, user_id),
+            )
+        return cursor.rowcount > 0
 
     async def deliver_subscription(
         self, subscription_id: str, user_id: str = DEFAULT_USER_ID
     ) -> Optional[Dict[str, Any]]:
-        data = self._load_data()
-        target = next(
-            (
-                row
-                for row in data["subscriptions"]
-                if row.get("id") == subscription_id and row.get("user_id") == user_id
-            ),
-            None,
-        )
-        if target is None:
+        with self._lock:
+            row = self._fetch_one(subscription_id, user_id)
+        if row is None:
             return None
 
-        if not bool(target.get("enabled", True)):
-            return {
-                "subscription_id": target["id"],
-                "subscription_name": target["name"],
-                "keywords": target.get("keywords", []),
-                "delivered_at": _utc_now(),
-                "content": "该订阅已禁用，未执行新闻推送。",
-            }
+        if not row["enabled"]:
+            return _delivery(row, "该订阅已禁用，未执行新闻推送。", _utc_now())
 
-        query = self._build_query(target)
-        content = await web_search(query)
+        content = await web_search(self._build_query(row))
 
         now = _utc_now()
-        target["last_run_at"] = _to_iso(now)
-        target["next_run_at"] = _to_iso(
-            now + timedelta(minutes=int(target["interval_minutes"]))
-        )
-        target["updated_at"] = _to_iso(now)
-        self._save_data(data)
-
-        return {
-            "subscription_id": target["id"],
-            "subscription_name": target["name"],
-            "keywords": target.get("keywords", []),
-            "delivered_at": now,
-            "content": content,
-        }
+        with self._lock:
+            self._connection().execute(
+                _MARK_DELIVERED_SQL, _mark_delivered_params(row, _to_epoch(now))
+            )
+        return _delivery(row, content, now)
 
     async def deliver_due_subscriptions(
         self,
         user_id: str = DEFAULT_USER_ID,
     ) -> List[Dict[str, Any]]:
+        # Integer comparison against the indexed epoch column; no datetime
+        # values are built for rows on the poll path.
         now = _utc_now()
-        rows = self.list_subscriptions(user_id)
+        now_epoch = _to_epoch(now)
+        today = now.strftime("%Y-%m-%d")
+        due_rows: List[sqlite3.Row] = []
+        due_queries: List[str] = []
+        with self._read_lock:
+            for row in self._iter_due_rows(user_id, now_epoch):
+                due_rows.append(row)
+                due_queries.append(self._build_query(row, today))
+        if not due_queries:
+            return []
 
-        due_ids = []
-        for row in rows:
-            if not bool(row.get("enabled", True)):
-                continue
+        # Subscriptions sharing the same keyword set share a single search
+        unique_queries = list(dict.fromkeys(due_queries))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            next_run_at = _from_iso(row.get("next_run_at"))
-            if next_run_at is None or next_run_at <= now:
-                due_ids.append(row["id"])
+        async def search(query: str) -> str:
+            async with semaphore:
+                return await web_search(query)
 
-        if not due_ids:
-            return []
+        results = await asyncio.gather(*(search(q) for q in unique_queries))
+        content_by_query = dict(zip(unique_queries, results))
 
-        deliveries = await asyncio.gather(
-            *(self.deliver_subscription(subscription_id, user_id) for subscription_id in due_ids)
-        )
-        return [delivery for delivery in deliveries if delivery is not None]
+        # Every search has finished, so the timestamp updates go out in one
+        # short synchronous transaction; the due rows are delivered directly
+        # rather than looked up again by id.
+        with self.batch() as conn:
+            conn.executemany(
+                _MARK_DELIVERED_SQL,
+                [_mark_delivered_params(row, now_epoch) for row in due_rows],
+            )
+        return [
+            _delivery(row, content_by_query[query], now)
+            for row, query in zip(due_rows, due_queries)
+        ]
 
     @staticmethod
-    def _build_query(row: Dict[str, Any]) -> str:
-        keywords = row.get("keywords", [])
-        keyword_clause = " OR ".join(str(item) for item in keywords)
-        realtime_clause = "实时" if row.get("realtime_tracking", True) else "最新"
-        today = _utc_now().strftime("%Y-%m-%d")
+    def _build_query(row: sqlite3.Row, today: Optional[str] = None) -> str:
+        keyword_clause = _keyword_clause(row["keywords_json"])
+        realtime_clause = "实时" if row["realtime_tracking"] else "最新"
+        if today is None:
+            today = _utc_now().strftime("%Y-%m-%d")
         return f"{realtime_clause} 新闻 {keyword_clause} {today}"
 
 
@@ -0,0 +1,242 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+
+import valuecell.server.services.news_subscription_service as svc_mod
+from valuecell.server.services.news_subscription_service import (
+    NewsSubscriptionService,
+)
+
+
+class _Clock:
+    """Controllable replacement for the service's ``_utc_now``."""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs) -> None:
+        self.now += timedelta(**kwargs)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock(datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc))
+    monkeypatch.setattr(svc_mod, "_utc_now", c)
+    return c
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    queries = []
+
+    async def fake_web_search(query: str) -> str:
+        queries.append(query)
+        return f"content for {query}"
+
+    monkeypatch.setattr(svc_mod, "web_search", fake_web_search)
+    return queries
+
+
+@pytest.fixture
+def service(tmp_path, clock):
+    return NewsSubscriptionService(
+        db_path=str(tmp_path / "valuecell.db"),
+        legacy_path=tmp_path / "news_subscriptions.json",
+    )
+
+
+def test_imports_legacy_file_and_renames_it(tmp_path):
+    legacy = tmp_path / "news_subscriptions.json"
+    legacy.write_bytes(
+        orjson.dumps(
+            {
+                "subscriptions": [
+                    {
+                        "id": "legacy-1",
+                        "user_id": svc_mod.DEFAULT_USER_ID,
+                        "name": "油价",
+                        "keywords": ["原油", "OPEC"],
+                        "interval_minutes": 30,
+                        "enabled": True,
+                        "realtime_tracking": False,
+                        "next_run_at": "2025-01-01T00:00:00+00:00",
+                        "created_at": "2024-12-01T00:00:00+00:00",
+                        "updated_at": "2024-12-02T00:00:00+00:00",
+                    }
+                ]
+            }
+        )
+    )
+    service = NewsSubscriptionService(
+        db_path=str(tmp_path / "valuecell.db"), legacy_path=legacy
+    )
+
+    rows = service.list_subscriptions()
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["id"] == "legacy-1"
+    assert row["keywords"] == ["原油", "OPEC"]
+    assert row["realtime_tracking"] is False
+    assert row["next_run_at"] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert row["updated_at"] == datetime(2024, 12, 2, tzinfo=timezone.utc)
+
+    assert not legacy.exists()
+    assert (tmp_path / "news_subscriptions.json.migrated").exists()
+
+
+def test_malformed_legacy_file_is_left_in_place(tmp_path):
+    legacy = tmp_path / "news_subscriptions.json"
+    legacy.write_bytes(b"{not json")
+    service = NewsSubscriptionService(
+        db_path=str(tmp_path / "valuecell.db"), legacy_path=legacy
+    )
+
+    assert service.list_subscriptions() == []
+    assert legacy.read_bytes() == b"{not json"
+    assert not (tmp_path / "news_subscriptions.json.migrated").exists()
+
+
+def test_create_and_list_newest_first(service, clock):
+    created_at = clock.now
+    first = service.create_subscription("first", [" AI ", "AI", "chip"], 5, True, True)
+    clock.advance(seconds=10)
+    second = service.create_subscription("second", ["oil"], 10, False, False)
+
+    assert first["keywords"] == ["AI", "chip"]
+    assert first["next_run_at"] == created_at + timedelta(minutes=5)
+    assert second["next_run_at"] is None
+
+    assert [row["id"] for row in service.list_subscriptions()] == [
+        second["id"],
+        first["id"],
+    ]
+
+    clock.advance(seconds=10)
+    service.update_subscription(first["id"], name="first again")
+    assert [row["id"] for row in service.list_subscriptions()] == [
+        first["id"],
+        second["id"],
+    ]
+
+
+def test_create_rejects_empty_keywords(service):
+    with pytest.raises(ValueError):
+        service.create_subscription("empty", ["  "], 5, True, True)
+
+
+def test_update_next_run_rules(service, clock):
+    row = service.create_subscription("s", ["AI"], 5, True, True)
+    scheduled = row["next_run_at"]
+
+    # Future schedule is kept on unrelated edits
+    clock.advance(minutes=1)
+    assert service.update_subscription(row["id"], name="s2")["next_run_at"] == (
+        scheduled
+    )
+
+    # Disabling clears the schedule
+    disabled = service.update_subscription(row["id"], enabled=False)
+    assert disabled["enabled"] is False
+    assert disabled["next_run_at"] is None
+
+    # Re-enabling schedules one interval from now
+    clock.advance(minutes=1)
+    enabled = service.update_subscription(row["id"], enabled=True)
+    assert enabled["next_run_at"] == clock.now + timedelta(minutes=5)
+
+    # A past-due schedule is pushed forward using the new interval
+    clock.advance(minutes=30)
+    updated = service.update_subscription(row["id"], interval_minutes=15)
+    assert updated["next_run_at"] == clock.now + timedelta(minutes=15)
+    assert updated["updated_at"] == clock.now
+
+    assert service.update_subscription("missing", name="x") is None
+
+
+def test_delete(service):
+    row = service.create_subscription("s", ["AI"], 5, True, True)
+
+    assert service.delete_subscription(row["id"]) is True
+    assert service.delete_subscription(row["id"]) is False
+    assert service.list_subscriptions() == []
+
+
+@pytest.mark.asyncio
+async def test_deliver_due_searches_once_per_keyword_set(service, clock, searches):
+    a = service.create_subscription("a", ["AI", "chip"], 5, True, True)
+    b = service.create_subscription("b", ["chip", "AI"], 10, True, True)
+    c = service.create_subscription("c", ["oil"], 20, True, False)
+    d = service.create_subscription("d", ["gold"], 5, False, True)
+
+    clock.advance(minutes=30)
+    deliveries = await service.deliver_due_subscriptions()
+
+    assert {item["subscription_id"] for item in deliveries} == {
+        a["id"],
+        b["id"],
+        c["id"],
+    }
+    assert len(searches) == 2
+    by_id = {item["subscription_id"]: item for item in deliveries}
+    assert by_id[a["id"]]["content"] == by_id[b["id"]]["content"]
+    assert "最新" in by_id[c["id"]]["content"]
+
+    rows = {row["id"]: row for row in service.list_subscriptions()}
+    for sub, interval in ((a, 5), (b, 10), (c, 20)):
+        assert rows[sub["id"]]["last_run_at"] == clock.now
+        assert rows[sub["id"]]["next_run_at"] == clock.now + timedelta(minutes=interval)
+    assert rows[d["id"]]["last_run_at"] is None
+
+
+@pytest.mark.asyncio
+async def test_deliver_due_skips_future_schedules(service, clock, searches):
+    service.create_subscription("later", ["AI"], 60, True, True)
+
+    clock.advance(minutes=59)
+    assert await service.deliver_due_subscriptions() == []
+    assert searches == []
+
+    clock.advance(minutes=1)
+    assert len(await service.deliver_due_subscriptions()) == 1
+    assert searches == ["实时 新闻 AI 2025-01-01"]
+
+
+@pytest.mark.asyncio
+async def test_deliver_disabled_subscription_does_not_search(service, searches):
+    row = service.create_subscription("off", ["AI"], 5, False, True)
+
+    delivery = await service.deliver_subscription(row["id"])
+
+    assert delivery["content"] == "该订阅已禁用，未执行新闻推送。"
+    assert searches == []
+    assert await service.deliver_subscription("missing") is None
+
+
+def test_list_cache_is_reused_and_invalidated_by_writes(service, tmp_path):
+    row = service.create_subscription("s", ["AI"], 5, True, True)
+
+    first = service.list_subscriptions()
+    assert service.list_subscriptions()[0] is first[0]
+
+    service.update_subscription(row["id"], name="renamed")
+    assert service.list_subscriptions()[0]["name"] == "renamed"
+
+    # Commits from another connection invalidate the cache as well
+    external = sqlite3.connect(tmp_path / "valuecell.db")
+    try:
+        external.execute(
+            "UPDATE news_subscriptions SET name = ? WHERE id = ?",
+            ("external", row["id"]),
+        )
+        external.commit()
+    finally:
+        external.close()
+    assert service.list_subscriptions()[0]["name"] == "external"
+
+    service.delete_subscription(row["id"])
+    assert service.list_subscriptions() == []
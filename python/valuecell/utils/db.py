@@ -1,5 +1,7 @@
+import errno
 import os
 import shutil
+from functools import cache
 from pathlib import Path
 
 from .env import get_system_env_dir
@@ -14,7 +16,17 @@ def resolve_default_data_dir() -> Path:
     2) Windows: `D:/ValueCell/data`
     3) Other OS: system app config directory (same base as `.env`)
     """
-    configured_dir = os.environ.get("VALUECELL_DATA_DIR")
+    return _resolve_default_data_dir(os.environ.get("VALUECELL_DATA_DIR"))
+
+
+# The resolvers below are memoized. Results are keyed on the VALUECELL_*
+# variables they read, so overriding those takes effect on the next call.
+# The system directory (derived from HOME/APPDATA) is read once per process,
+# and the mkdir/migration steps run once per key: call
+# `clear_db_path_caches()` to re-resolve everything, e.g. after changing HOME
+# or removing the data directory.
+@cache
+def _resolve_default_data_dir(configured_dir: str | None) -> Path:
     if configured_dir:
         return Path(configured_dir).expanduser()
 
@@ -24,6 +36,14 @@ def resolve_default_data_dir() -> Path:
     return Path(get_system_env_dir())
 
 
+def clear_db_path_caches() -> None:
+    """Drop memoized paths so the next call re-resolves and re-creates them."""
+    _resolve_default_data_dir.cache_clear()
+    _legacy_db_path.cache_clear()
+    _resolve_db_path.cache_clear()
+    _resolve_lancedb_uri.cache_clear()
+
+
 def _strip_sqlite_prefix(url_or_path: str) -> str:
     """Normalize a potential SQLite DSN to a filesystem path.
 
@@ -35,15 +55,27 @@ def _strip_sqlite_prefix(url_or_path: str) -> str:
     return url_or_path
 
 
+@cache
 def _legacy_db_path() -> Path:
     return Path(get_system_env_dir()) / "valuecell.db"
 
 
 def _move_if_exists(src: Path, dst: Path) -> None:
-    if not src.exists() or dst.exists():
+    """Move `src` to `dst` unless `src` is missing or `dst` already exists.
+
+    Uses a metadata-only rename; only a cross-device move falls back to
+    copying the file contents.
+    """
+    if dst.exists():
         return
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(str(src), str(dst))
+    try:
+        os.rename(src, dst)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
 
 
 def _migrate_legacy_db_files(target_db_path: Path) -> None:
@@ -51,6 +83,7 @@ def _migrate_legacy_db_files(target_db_path: Path) -> None:
     if target_db_path.exists() or legacy_db_path == target_db_path:
         return
 
+    target_db_path.parent.mkdir(parents=True, exist_ok=True)
     _move_if_exists(legacy_db_path, target_db_path)
     _move_if_exists(legacy_db_path.with_suffix(".db-wal"), target_db_path.with_suffix(".db-wal"))
     _move_if_exists(legacy_db_path.with_suffix(".db-shm"), target_db_path.with_suffix(".db-shm"))
@@ -66,14 +99,21 @@ def resolve_db_path() -> str:
 
     Note: This function returns a filesystem path, not a SQLAlchemy DSN.
     """
+    return _resolve_db_path(
+        os.environ.get("VALUECELL_DATABASE_URL"),
+        os.environ.get("VALUECELL_DATA_DIR"),
+    )
+
+
+@cache
+def _resolve_db_path(db_url: str | None, data_dir: str | None) -> str:
     # Prefer VALUECELL_DATABASE_URL if it points to SQLite
-    db_url = os.environ.get("VALUECELL_DATABASE_URL")
     if db_url and db_url.startswith("sqlite:///"):
         db_path = Path(_strip_sqlite_prefix(db_url))
         db_path.parent.mkdir(parents=True, exist_ok=True)
         return str(db_path)
 
-    default_db_path = resolve_default_data_dir() / "valuecell.db"
+    default_db_path = _resolve_default_data_dir(data_dir) / "valuecell.db"
     try:
         _migrate_legacy_db_files(default_db_path)
     except Exception:
@@ -89,10 +129,17 @@ def resolve_lancedb_uri() -> str:
     1) Default to system application directory: `<system_env_dir>/lancedb`
 
     Additionally, if an old repo-root `lancedb` directory exists and the new
-    system directory does not, migrate the contents once for continuity.
+    system directory does not, migrate the contents once for continuity. The
+    old directory is renamed into place when possible and only copied across
+    filesystems.
     """
+    return _resolve_lancedb_uri(os.environ.get("VALUECELL_DATA_DIR"))
+
+
+@cache
+def _resolve_lancedb_uri(data_dir: str | None) -> str:
     # Default: use application data directory
-    new_path = resolve_default_data_dir() / "lancedb"
+    new_path = _resolve_default_data_dir(data_dir) / "lancedb"
     new_path.mkdir(parents=True, exist_ok=True)
 
     # Migrate from old locations if needed
@@ -107,13 +154,14 @@ def resolve_lancedb_uri() -> str:
                 migration_source = old_path
 
             if migration_source is not None:
-                for item in migration_source.iterdir():
-                    src = item
-                    dst = new_path / item.name
-                    if item.is_dir():
-                        shutil.copytree(src, dst, dirs_exist_ok=True)
-                    else:
-                        shutil.copy2(src, dst)
+                new_path.rmdir()
+                try:
+                    os.rename(migration_source, new_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        new_path.mkdir(parents=True, exist_ok=True)
+                        raise
+                    shutil.copytree(migration_source, new_path)
     except Exception:
         # Non-fatal: if migration fails, just proceed with new_path
         pass
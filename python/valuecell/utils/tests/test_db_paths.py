@@ -0,0 +1,101 @@
+import errno
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from valuecell.utils import db
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    """Point the resolvers at a temporary system dir, repo root and data dir."""
+    system_dir = tmp_path / "system"
+    repo_root = tmp_path / "repo"
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(db, "get_system_env_dir", lambda: system_dir)
+    monkeypatch.setattr(db, "get_repo_root_path", lambda: str(repo_root))
+    monkeypatch.setenv("VALUECELL_DATA_DIR", str(data_dir))
+    monkeypatch.delenv("VALUECELL_DATABASE_URL", raising=False)
+    db.clear_db_path_caches()
+    yield system_dir, data_dir
+    db.clear_db_path_caches()
+
+
+def _make_legacy_lancedb(system_dir: Path) -> Path:
+    legacy = system_dir / "lancedb"
+    (legacy / "docs.lance").mkdir(parents=True)
+    (legacy / "docs.lance" / "data.bin").write_bytes(b"vectors")
+    return legacy
+
+
+def _fail_rename_of(source: Path, error: int, monkeypatch) -> None:
+    real_rename = os.rename
+
+    def rename(src, dst):
+        if Path(src) == source:
+            raise OSError(error, os.strerror(error))
+        real_rename(src, dst)
+
+    monkeypatch.setattr(db.os, "rename", rename)
+
+
+def test_lancedb_migration_renames_legacy_dir(dirs):
+    system_dir, data_dir = dirs
+    legacy = _make_legacy_lancedb(system_dir)
+
+    uri = db.resolve_lancedb_uri()
+
+    assert uri == str(data_dir / "lancedb")
+    assert (data_dir / "lancedb" / "docs.lance" / "data.bin").read_bytes() == (
+        b"vectors"
+    )
+    assert not legacy.exists()
+
+
+def test_lancedb_migration_copies_across_devices(dirs, monkeypatch):
+    system_dir, data_dir = dirs
+    legacy = _make_legacy_lancedb(system_dir)
+    _fail_rename_of(legacy, errno.EXDEV, monkeypatch)
+
+    uri = db.resolve_lancedb_uri()
+
+    assert (Path(uri) / "docs.lance" / "data.bin").read_bytes() == b"vectors"
+    assert (legacy / "docs.lance" / "data.bin").exists()
+
+
+def test_lancedb_migration_failure_keeps_new_path(dirs, monkeypatch):
+    system_dir, data_dir = dirs
+    legacy = _make_legacy_lancedb(system_dir)
+    _fail_rename_of(legacy, errno.EACCES, monkeypatch)
+
+    uri = db.resolve_lancedb_uri()
+
+    assert uri == str(data_dir / "lancedb")
+    assert Path(uri).is_dir()
+    assert list(Path(uri).iterdir()) == []
+    assert (legacy / "docs.lance" / "data.bin").exists()
+
+
+def test_resolved_paths_are_cached_until_cleared(dirs, tmp_path, monkeypatch):
+    _, data_dir = dirs
+    uri = db.resolve_lancedb_uri()
+    db_path = db.resolve_db_path()
+    assert db_path == str(data_dir / "valuecell.db")
+
+    # A cached result skips the mkdir, so a removed directory stays removed
+    shutil.rmtree(data_dir)
+    assert db.resolve_lancedb_uri() == uri
+    assert db.resolve_db_path() == db_path
+    assert not data_dir.exists()
+
+    db.clear_db_path_caches()
+    assert db.resolve_lancedb_uri() == uri
+    assert Path(uri).is_dir()
+
+    # Changing the configured data dir resolves a new location right away
+    other = tmp_path / "other"
+    monkeypatch.setenv("VALUECELL_DATA_DIR", str(other))
+    assert db.resolve_lancedb_uri() == str(other / "lancedb")
+    assert db.resolve_db_path() == str(other / "valuecell.db")